@@ -8,7 +8,7 @@ from langchain_core.messages import AIMessage
 from langgraph.graph import END, StateGraph
 from langgraph.prebuilt import ToolNode
 
-from utils import create_llm, get_today_str, get_currency_config
+from utils import create_llm, format_prompt, get_today_str, get_currency_config
 from models import AgentState, AnalysisResult
 from prompts import generate_query_system_prompt, check_query_system_prompt, analysis_prompt
 
@@ -55,7 +55,8 @@ def generate_query(state: AgentState):
     
     system_message = {
         "role": "system",
-        "content": generate_query_system_prompt.format(
+        "content": format_prompt(
+            generate_query_system_prompt,
             dialect=db.dialect,
             top_k=5,
             operation_type=operation_type,
@@ -89,7 +90,7 @@ def generate_query(state: AgentState):
 def check_query(state: AgentState):
     system_message = {
         "role": "system",
-        "content": check_query_system_prompt.format(dialect=db.dialect),
+        "content": format_prompt(check_query_system_prompt, dialect=db.dialect),
     }
 
     tool_call = state["messages"][-1].tool_calls[0]
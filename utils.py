@@ -1,5 +1,6 @@
 from langchain.chat_models import init_chat_model 
 from datetime import datetime
+from functools import lru_cache
 import sqlite3
 
 import os
@@ -16,15 +17,39 @@ def create_llm():
     return init_chat_model(
         model=model,
         model_provider=provider,
-        temperature=temperature
+        temperature=temperature,
+        cache=get_llm_cache()
     )
 
+@lru_cache(maxsize=None)
+def get_llm_cache():
+    """Get the persistent LLM response cache, or None if LLM_CACHE_PATH is unset"""
+    cache_path = os.getenv("LLM_CACHE_PATH")
+    if not cache_path:
+        return None
+
+    from llm_cache import SQLiteLLMCache
+
+    max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+    return SQLiteLLMCache(database_path=cache_path, max_entries=max_entries)
+
+@lru_cache(maxsize=256)
+def format_prompt(template: str, **kwargs) -> str:
+    """Format a prompt template, reusing the result for repeated arguments"""
+    return template.format(**kwargs)
+
 def get_today_str() -> str:
     """Get current date in a human-readable format."""
     return datetime.now().strftime("%a %b %-d, %Y")
 
 def get_currency_config():
     """Get currency configuration"""
+    # Default to naira, or get from environment
+    currency_type = os.getenv("CURRENCY_TYPE", "naira").lower()
+    return _build_currency_config(currency_type)
+
+@lru_cache(maxsize=None)
+def _build_currency_config(currency_type: str):
     # You can modify this or make it configurable via environment variables
     currency_configs = {
         "naira": {
@@ -44,8 +69,6 @@ def get_currency_config():
         }
     }
     
-    # Default to naira, or get from environment
-    currency_type = os.getenv("CURRENCY_TYPE", "naira").lower()
     return currency_configs.get(currency_type, currency_configs["naira"])
 
 def init_db():